@@ -0,0 +1,95 @@
+import threading
+from collections import deque
+
+class DetectionFeed:
+    """Bounded, thread-safe buffer of detection events for the GUI.
+
+    Recognition threads push events; the Tk thread drains them in batches.
+    A repeat of any still-pending event for the same person on the same
+    camera is coalesced into it. When a new event arrives and the pending
+    queue is full, the oldest pending event is dropped: it is evicted from
+    the buffer entirely and will not show up in search either.
+    """
+    def __init__(self, capacity=500, pending_limit=200):
+        self.lock = threading.Lock()
+        self.recent = deque(maxlen=capacity)
+        self.pending = {}             # (name, regno, camera_id) -> event
+        self.pending_order = deque()  # pending keys, oldest first
+        self.pending_limit = pending_limit
+        self.total = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def push(self, name, regno, camera_id, confidence, timestamp):
+        """Record a detection event (safe to call from any thread)"""
+        key = (name, regno, camera_id)
+        with self.lock:
+            self.total += 1
+            event = self.pending.get(key)
+            if event is not None:
+                event['timestamp'] = timestamp
+                event['confidence'] = confidence
+                event['count'] += 1
+                self.coalesced += 1
+                return
+
+            if len(self.pending_order) >= self.pending_limit:
+                self.evict(self.pending.pop(self.pending_order.popleft()))
+                self.dropped += 1
+
+            event = {
+                'name': name,
+                'regno': regno,
+                'camera_id': camera_id,
+                'confidence': confidence,
+                'timestamp': timestamp,
+                'count': 1
+            }
+            self.pending[key] = event
+            self.pending_order.append(key)
+            self.recent.append(event)
+
+    def evict(self, event):
+        """Remove a dropped event from the recent buffer (caller holds the lock)"""
+        for index, recent_event in enumerate(self.recent):
+            if recent_event is event:
+                del self.recent[index]
+                break
+
+    def drain(self):
+        """Return and clear all events not yet displayed, oldest first"""
+        with self.lock:
+            batch = [self.pending[key] for key in self.pending_order]
+            self.pending.clear()
+            self.pending_order.clear()
+        return batch
+
+    def search(self, query="", camera_id=None, limit=50):
+        """Return copies of the newest matching recent events, oldest first"""
+        query = query.strip().lower()
+        matches = []
+        with self.lock:
+            for event in reversed(self.recent):
+                if camera_id and event['camera_id'] != camera_id:
+                    continue
+                if query and query not in f"{event['name']} {event['regno']} {event['camera_id']}".lower():
+                    continue
+                matches.append(dict(event))
+                if len(matches) >= limit:
+                    break
+        matches.reverse()
+        return matches
+
+    def stats(self):
+        """Return (total, coalesced, dropped) event counters"""
+        with self.lock:
+            return self.total, self.coalesced, self.dropped
+
+    @staticmethod
+    def format_event(event):
+        """Format an event as one line of the detection panel"""
+        line = (f"[{event['timestamp'].strftime('%H:%M:%S')}] {event['name']} ({event['regno']}) "
+                f"detected on {event['camera_id']} - {event['confidence']:.1f}%")
+        if event['count'] > 1:
+            line += f" x{event['count']}"
+        return line + "\n"
@@ -13,7 +13,12 @@ import requests
 import socket
 from urllib.parse import urlparse
 
+from detection_feed import DetectionFeed
+
 class GodsEyeRecognition:
+    FEED_REFRESH_MS = 250  # Detection panel refresh interval
+    FEED_MAX_LINES = 50    # Lines kept in the detection panel
+
     def __init__(self):
         self.conn = sqlite3.connect("gods_eye_faces.db", check_same_thread=False)
         self.c = self.conn.cursor()
@@ -30,6 +35,7 @@ class GodsEyeRecognition:
         
         self.detections = {}
         self.detection_history = []
+        self.detection_feed = DetectionFeed()
         
         self.setup_gui()
         
@@ -119,6 +125,32 @@ class GodsEyeRecognition:
                 bg='#1a1a1a', fg='#00ffff', 
                 font=('Arial', 14, 'bold')).pack(pady=5)
         
+        # Filter / search over recent detections (in-memory, no database hit)
+        filter_frame = tk.Frame(info_frame, bg='#1a1a1a')
+        filter_frame.pack(fill=tk.X, padx=10)
+        
+        tk.Label(filter_frame, text="Search:", bg='#1a1a1a', fg='white',
+                font=('Arial', 10)).pack(side=tk.LEFT)
+        self.feed_search_var = tk.StringVar()
+        tk.Entry(filter_frame, textvariable=self.feed_search_var, width=30,
+                font=('Arial', 10)).pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(filter_frame, text="Camera:", bg='#1a1a1a', fg='white',
+                font=('Arial', 10)).pack(side=tk.LEFT, padx=(10, 0))
+        self.feed_camera_var = tk.StringVar(value="All")
+        camera_combo = ttk.Combobox(filter_frame, textvariable=self.feed_camera_var,
+                                    state='readonly', width=15,
+                                    postcommand=lambda: camera_combo.configure(
+                                        values=["All"] + list(self.cameras.keys())))
+        camera_combo.pack(side=tk.LEFT, padx=5)
+        
+        self.feed_stats_var = tk.StringVar(value="0 events | 0 coalesced | 0 dropped")
+        tk.Label(filter_frame, textvariable=self.feed_stats_var, bg='#1a1a1a',
+                fg='#888888', font=('Arial', 9)).pack(side=tk.RIGHT)
+        
+        self.feed_search_var.trace_add('write', lambda *args: self.render_filtered_feed())
+        self.feed_camera_var.trace_add('write', lambda *args: self.render_filtered_feed())
+        
         self.detection_text = tk.Text(info_frame, height=8, bg='black', 
                                      fg='#00ff00', font=('Courier', 10))
         self.detection_text.pack(fill=tk.X, padx=10, pady=5)
@@ -129,6 +161,42 @@ class GodsEyeRecognition:
                              bg='#333333', fg='white', 
                              font=('Arial', 10), relief='sunken', bd=1)
         status_bar.pack(fill=tk.X, pady=5)
+        
+        self.root.after(self.FEED_REFRESH_MS, self.refresh_detection_feed)
+    
+    def feed_filter_active(self):
+        """Return True if a search term or camera filter is set"""
+        return bool(self.feed_search_var.get().strip()) or self.feed_camera_var.get() != "All"
+    
+    def render_filtered_feed(self):
+        """Redraw the detection panel from the recent-event buffer"""
+        camera_id = self.feed_camera_var.get()
+        events = self.detection_feed.search(self.feed_search_var.get(),
+                                            None if camera_id == "All" else camera_id,
+                                            limit=self.FEED_MAX_LINES)
+        self.detection_text.delete(1.0, tk.END)
+        self.detection_text.insert(tk.END, "".join(DetectionFeed.format_event(e) for e in events))
+        self.detection_text.see(tk.END)
+    
+    def refresh_detection_feed(self):
+        """Drain pending detections into the panel (runs on the Tk thread)"""
+        batch = self.detection_feed.drain()
+        if batch:
+            if self.feed_filter_active():
+                self.render_filtered_feed()
+            else:
+                self.detection_text.insert(tk.END, "".join(DetectionFeed.format_event(e) for e in batch))
+                
+                # Keep only the last FEED_MAX_LINES entries
+                line_count = int(self.detection_text.index('end-1c').split('.')[0]) - 1
+                if line_count > self.FEED_MAX_LINES:
+                    self.detection_text.delete(1.0, f"{line_count - self.FEED_MAX_LINES + 1}.0")
+                self.detection_text.see(tk.END)
+            
+            total, coalesced, dropped = self.detection_feed.stats()
+            self.feed_stats_var.set(f"{total} events | {coalesced} coalesced | {dropped} dropped")
+        
+        self.root.after(self.FEED_REFRESH_MS, self.refresh_detection_feed)
     
     def add_phone_camera(self):
         """Add phone camera via IP with optimization"""
@@ -452,8 +520,9 @@ class GodsEyeRecognition:
                 (right, top + (bottom - top) // 2), (0, 255, 255), 1)
     
     def log_detection(self, name, regno, camera_id, confidence):
-        """Log detection to database and update display"""
-        timestamp = datetime.now().isoformat()
+        """Log detection to database and queue it for display"""
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         # Save to database
         self.c.execute("""INSERT INTO detections 
@@ -462,16 +531,8 @@ class GodsEyeRecognition:
                       (name, regno, camera_id, timestamp, confidence))
         self.conn.commit()
         
-        # Update detection display
-        detection_info = f"[{datetime.now().strftime('%H:%M:%S')}] {name} ({regno}) detected on {camera_id} - {confidence:.1f}%\n"
-        
-        self.detection_text.insert(tk.END, detection_info)
-        self.detection_text.see(tk.END)
-        
-        # Keep only last 50 entries
-        lines = self.detection_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 50:
-            self.detection_text.delete(1.0, f"{len(lines)-50}.0")
+        # Queue for the GUI; the Tk thread drains it in refresh_detection_feed
+        self.detection_feed.push(name, regno, camera_id, confidence, now)
     
     def run(self):
         """Start the application"""
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+from detection_feed import DetectionFeed
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+def push(feed, name, camera_id="laptop_0", seconds=0, confidence=90.0):
+    feed.push(name, f"REG_{name}", camera_id, confidence, BASE_TIME + timedelta(seconds=seconds))
+
+def test_interleaved_repeats_are_coalesced():
+    feed = DetectionFeed(pending_limit=3)
+    for i, name in enumerate("ABABA"):
+        push(feed, name, seconds=i)
+
+    assert feed.stats() == (5, 3, 0)
+    batch = feed.drain()
+    assert [(e['name'], e['count']) for e in batch] == [('A', 3), ('B', 2)]
+    assert batch[0]['timestamp'] == BASE_TIME + timedelta(seconds=4)
+
+def test_same_person_on_different_cameras_is_not_coalesced():
+    feed = DetectionFeed()
+    push(feed, "A", camera_id="laptop_0")
+    push(feed, "A", camera_id="phone_0")
+
+    assert feed.stats() == (2, 0, 0)
+    assert len(feed.drain()) == 2
+
+def test_drain_clears_pending():
+    feed = DetectionFeed()
+    push(feed, "A")
+    assert len(feed.drain()) == 1
+    assert feed.drain() == []
+
+    push(feed, "A")
+    assert [e['count'] for e in feed.drain()] == [1]
+
+def test_new_key_at_pending_limit_drops_oldest():
+    feed = DetectionFeed(pending_limit=3)
+    for name in "ABCD":
+        push(feed, name)
+    push(feed, "D")
+
+    assert feed.stats() == (5, 1, 1)
+    assert [e['name'] for e in feed.drain()] == ['B', 'C', 'D']
+    assert [e['name'] for e in feed.search()] == ['B', 'C', 'D']
+
+def test_recent_capacity():
+    feed = DetectionFeed(capacity=3)
+    for name in "ABCDE":
+        push(feed, name)
+
+    assert [e['name'] for e in feed.search()] == ['C', 'D', 'E']
+
+def test_search_by_name_regno_and_camera_oldest_first():
+    feed = DetectionFeed()
+    push(feed, "Alice", camera_id="laptop_0", seconds=0)
+    push(feed, "Bob", camera_id="phone_0", seconds=1)
+    push(feed, "alina", camera_id="phone_0", seconds=2)
+
+    assert [e['name'] for e in feed.search("ali")] == ['Alice', 'alina']
+    assert [e['name'] for e in feed.search("reg_bob")] == ['Bob']
+    assert [e['name'] for e in feed.search("phone")] == ['Bob', 'alina']
+    assert [e['name'] for e in feed.search(camera_id="phone_0")] == ['Bob', 'alina']
+    assert [e['name'] for e in feed.search(limit=2)] == ['Bob', 'alina']
+
+def test_search_returns_copies():
+    feed = DetectionFeed()
+    push(feed, "A", confidence=80.0)
+    result = feed.search()[0]
+    push(feed, "A", confidence=95.0)
+
+    assert (result['confidence'], result['count']) == (80.0, 1)
+
+def test_format_event():
+    event = {'name': 'A', 'regno': 'R1', 'camera_id': 'laptop_0',
+             'confidence': 91.234, 'timestamp': BASE_TIME, 'count': 3}
+    assert DetectionFeed.format_event(event) == "[12:00:00] A (R1) detected on laptop_0 - 91.2% x3\n"